@@ -11,13 +11,20 @@ Implements the backend MVP described in ExecPlan.md:
 - GET /api/scene/{jobId}/metadata.json: return 360 metadata if present.
 """
 
-import shutil
+import asyncio
+import hashlib
+import os
+import re
 import uuid
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
+from typing import AsyncIterator
 
-from fastapi import BackgroundTasks, FastAPI, File, HTTPException, UploadFile
+import aiofiles
+from fastapi import BackgroundTasks, FastAPI, File, HTTPException, Request, UploadFile
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import FileResponse, JSONResponse
+from fastapi.responses import FileResponse, Response, StreamingResponse
 
 from .services import mlsharp, mode360, storage
 
@@ -31,13 +38,39 @@ app.add_middleware(
 )
 
 
+# Per-job-type limits: 360 jobs fan out into six ml-sharp runs plus heavy
+# NumPy post-processing, so they get their own (stricter) budget and cannot
+# head-of-line block quick single-image jobs.
+_JOB_CONCURRENCY = max(1, int(os.environ.get("SHARP_CONCURRENCY", "1")))
+_JOB_CONCURRENCY_360 = max(1, int(os.environ.get("SHARP_CONCURRENCY_360", "1")))
+
+# Keep strong references to in-flight job tasks so they are not GC'd mid-run.
+_job_tasks: set[asyncio.Task[None]] = set()
+
+
 @app.on_event("startup")
 def clear_cache_on_startup() -> None:
     storage.clear_data_root()
 
 
+@app.on_event("startup")
+def setup_job_pool() -> None:
+    app.state.job_pool = ThreadPoolExecutor(
+        max_workers=_JOB_CONCURRENCY + _JOB_CONCURRENCY_360, thread_name_prefix="sharp-job"
+    )
+    app.state.job_sems = {
+        "single": asyncio.Semaphore(_JOB_CONCURRENCY),
+        "360": asyncio.Semaphore(_JOB_CONCURRENCY_360),
+    }
+
+
+@app.on_event("shutdown")
+def teardown_job_pool() -> None:
+    app.state.job_pool.shutdown(wait=False, cancel_futures=True)
+
+
 @app.get("/health")
-def health() -> dict[str, str]:
+async def health() -> dict[str, str]:
     """
     Lightweight health endpoint to verify the server starts.
     """
@@ -45,25 +78,123 @@ def health() -> dict[str, str]:
     return {"status": "ok"}
 
 
-def _persist_upload(job_id: str, upload: UploadFile) -> Path:
+_UPLOAD_CHUNK_SIZE = 1 << 20
+# Received chunks are coalesced into one write() per buffer-full, cutting the
+# syscall count roughly 100x for large panorama uploads.
+_UPLOAD_BUFFER_SIZE = 8 << 20
+
+
+async def _write_upload_stream(target: Path, chunks: AsyncIterator[bytes]) -> str:
+    """
+    Write an async chunk stream to target with batched flushes.
+
+    Returns the hex content digest of the streamed bytes, used for job dedup.
+    """
+
+    hasher = hashlib.blake2b(digest_size=16)
+    buffer = bytearray()
+    async with aiofiles.open(target, "wb") as f:
+        async for chunk in chunks:
+            hasher.update(chunk)
+            buffer += chunk
+            if len(buffer) >= _UPLOAD_BUFFER_SIZE:
+                await f.write(buffer)
+                buffer.clear()
+        if buffer:
+            await f.write(buffer)
+    return hasher.hexdigest()
+
+
+async def _iter_upload(upload: UploadFile) -> AsyncIterator[bytes]:
+    while chunk := await upload.read(_UPLOAD_CHUNK_SIZE):
+        yield chunk
+
+
+def _kernel_copy_upload(spool, target: Path) -> str | None:
+    """
+    Move a disk-rolled multipart spool to target with os.copy_file_range,
+    keeping the bytes in the kernel (splice(2) itself needs a pipe endpoint,
+    copy_file_range is its file-to-file counterpart). The dedup digest is then
+    computed from the page-cache-hot destination.
+
+    Returns None when the kernel copy is not possible so the caller can fall
+    back to the buffered path.
+    """
+
+    try:
+        src_fd = spool.fileno()
+    except (OSError, ValueError):
+        return None
+    size = os.fstat(src_fd).st_size
+    try:
+        with target.open("wb") as dst:
+            offset = 0
+            while offset < size:
+                copied = os.copy_file_range(
+                    src_fd, dst.fileno(), size - offset, offset_src=offset, offset_dst=offset
+                )
+                if copied == 0:
+                    break
+                offset += copied
+            if offset < size:
+                return None
+    except OSError:
+        return None
+    hasher = hashlib.blake2b(digest_size=16)
+    with target.open("rb") as f:
+        while chunk := f.read(_UPLOAD_CHUNK_SIZE):
+            hasher.update(chunk)
+    return hasher.hexdigest()
+
+
+async def _persist_upload(job_id: str, upload: UploadFile) -> tuple[Path, str]:
+    """
+    Stream the upload to disk in chunks without blocking the event loop.
+
+    Returns the stored path and a content digest used for job dedup.
+    """
+
     filename = upload.filename or "input_image"
     target = storage.input_image_path(job_id, filename)
-    with target.open("wb") as f:
-        shutil.copyfileobj(upload.file, f)
-    return target
+    try:
+        digest = None
+        # Bodies above the multipart spool threshold are already on disk;
+        # move them file-to-file in the kernel instead of re-reading chunks
+        # through Python.
+        if hasattr(os, "copy_file_range") and getattr(upload.file, "_rolled", False):
+            digest = await asyncio.to_thread(_kernel_copy_upload, upload.file, target)
+        if digest is None:
+            digest = await _write_upload_stream(target, _iter_upload(upload))
+    finally:
+        await upload.close()
+    return target, digest
 
 
-def _start_job(job_id: str, input_path: Path, mlsharp_cli: str | None) -> None:
+async def _start_job(
+    job_id: str, input_path: Path, mlsharp_cli: str | None, cache_key: str | None = None
+) -> None:
     if mode360.is_360_filename(input_path.name):
         storage.write_status(job_id, {"status": "running", "message": "360 processing started"})
+        loop = asyncio.get_running_loop()
         try:
-            mode360.process_equirectangular_job(job_id, input_path, input_path.parent, mlsharp_cli)
+            # The 360 pipeline is CPU-heavy NumPy work, so it stays on the
+            # worker pool rather than the event loop.
+            await loop.run_in_executor(
+                app.state.job_pool,
+                mode360.process_equirectangular_job,
+                job_id,
+                input_path,
+                input_path.parent,
+                mlsharp_cli,
+            )
         except mode360.Mode360Error as exc:
             storage.write_status(job_id, {"status": "error", "message": str(exc)})
             return
         except Exception as exc:  # noqa: BLE001
             storage.write_status(job_id, {"status": "error", "message": f"360 failed: {exc}"})
             return
+        if cache_key:
+            storage.cache_job_outputs(cache_key, job_id)
         storage.write_status(job_id, {"status": "done", "message": "360 PLYs generated"})
         return
 
@@ -72,92 +203,216 @@ def _start_job(job_id: str, input_path: Path, mlsharp_cli: str | None) -> None:
         job_id=job_id, input_image=input_path, workdir=input_path.parent, cli=mlsharp_cli
     )
     try:
-        mlsharp.run_mlsharp(job)
+        await mlsharp.run_mlsharp_async(job)
     except mlsharp.MlSharpError as exc:
         storage.write_status(job_id, {"status": "error", "message": str(exc)})
         return
+    if cache_key:
+        storage.cache_job_outputs(cache_key, job_id)
     storage.write_status(job_id, {"status": "done", "message": "PLY generated"})
 
 
+async def _run_job_bounded(
+    job_id: str, input_path: Path, mlsharp_cli: str | None, cache_key: str | None
+) -> None:
+    """
+    Run _start_job under the semaphore for its job type so concurrent uploads
+    cannot spawn an unbounded number of ml-sharp processes and long 360 jobs
+    do not starve quick single-image ones.
+    """
+
+    job_type = "360" if mode360.is_360_filename(input_path.name) else "single"
+    async with app.state.job_sems[job_type]:
+        await _start_job(job_id, input_path, mlsharp_cli, cache_key)
+
+
+def _enqueue_job(
+    job_id: str, input_path: Path, mlsharp_cli: str | None, digest: str | None = None
+) -> None:
+    is_360 = mode360.is_360_filename(input_path.name)
+    # The filename picks the pipeline, so identical bytes can yield two
+    # different output sets; the cache key carries the mode next to the
+    # content digest so one mode never restores the other's outputs.
+    cache_key = f"{'360' if is_360 else 'single'}-{digest}" if digest else None
+    # 360 cache entries are served through stable face_*.ply names; single
+    # jobs are fetched as {stem}.ply, which depends on this upload's filename.
+    expected_ply = None if is_360 else f"{input_path.stem}.ply"
+    if cache_key and storage.restore_cached_outputs(cache_key, job_id, expected_ply):
+        storage.write_status(
+            job_id, {"status": "done", "message": "restored from upload cache"}
+        )
+        return
+    task = asyncio.get_running_loop().create_task(
+        _run_job_bounded(job_id, input_path, mlsharp_cli, cache_key)
+    )
+    _job_tasks.add(task)
+    task.add_done_callback(_job_tasks.discard)
+
+
 @app.post("/api/upload")
 async def upload_image(
     background_tasks: BackgroundTasks,
     file: UploadFile = File(...),
     mlsharp_cli: str | None = None,
-) -> JSONResponse:
+) -> dict[str, str | None]:
+    job_id = uuid.uuid4().hex
+    background_tasks.add_task(storage.clear_stale_jobs, job_id)
+    storage.write_status(job_id, {"status": "pending", "message": "upload received"})
     try:
-        storage.clear_data_root()
+        input_path, digest = await _persist_upload(job_id, file)
     except Exception as exc:  # noqa: BLE001
-        raise HTTPException(status_code=500, detail="failed to clear cache") from exc
+        storage.write_status(job_id, {"status": "error", "message": f"upload failed: {exc}"})
+        raise HTTPException(status_code=400, detail="failed to store upload") from exc
+
+    _enqueue_job(job_id, input_path, mlsharp_cli, digest)
+    return _upload_response(job_id, file.filename or "")
+
+
+@app.post("/api/upload/stream")
+async def upload_image_stream(
+    request: Request,
+    background_tasks: BackgroundTasks,
+    filename: str,
+    mlsharp_cli: str | None = None,
+) -> dict[str, str | None]:
+    """
+    Raw-body upload that writes the request stream straight to the final path,
+    skipping the multipart UploadFile spool (and its extra disk copy).
+    """
+
+    input_name = os.path.basename(filename)
+    if not input_name:
+        raise HTTPException(status_code=400, detail="invalid filename")
     job_id = uuid.uuid4().hex
+    background_tasks.add_task(storage.clear_stale_jobs, job_id)
     storage.write_status(job_id, {"status": "pending", "message": "upload received"})
+    target = storage.input_image_path(job_id, input_name)
     try:
-        input_path = _persist_upload(job_id, file)
+        digest = await _write_upload_stream(target, request.stream())
     except Exception as exc:  # noqa: BLE001
         storage.write_status(job_id, {"status": "error", "message": f"upload failed: {exc}"})
         raise HTTPException(status_code=400, detail="failed to store upload") from exc
 
-    background_tasks.add_task(_start_job, job_id, input_path, mlsharp_cli)
-    input_name = Path(file.filename or "").name
-    stem = Path(input_name).stem if input_name else "scene"
-    if input_name and mode360.is_360_filename(input_name):
+    _enqueue_job(job_id, target, mlsharp_cli, digest)
+    return _upload_response(job_id, input_name)
+
+
+def _upload_response(job_id: str, raw_filename: str) -> dict[str, str | None]:
+    input_name = os.path.basename(raw_filename)
+    stem = os.path.splitext(input_name)[0]
+    is_360 = bool(input_name) and mode360.is_360_filename(input_name)
+    if is_360:
         ply_name = "face_0.ply"
     else:
         ply_name = f"{stem}.ply" if stem else "scene.ply"
-    ply_url = f"/api/scene/{job_id}/{ply_name}"
-    status_url = f"/api/scene/{job_id}/status"
-    logs_url = f"/api/scene/{job_id}/logs"
-    meta_url = f"/api/scene/{job_id}/metadata.json" if input_name and mode360.is_360_filename(input_name) else None
-    return JSONResponse(
-        {
-            "jobId": job_id,
-            "plyUrl": ply_url,
-            "statusUrl": status_url,
-            "logsUrl": logs_url,
-            "metaUrl": meta_url,
-        }
-    )
+    base_url = f"/api/scene/{job_id}"
+    return {
+        "jobId": job_id,
+        "plyUrl": f"{base_url}/{ply_name}",
+        "statusUrl": f"{base_url}/status",
+        "logsUrl": f"{base_url}/logs",
+        "metaUrl": f"{base_url}/metadata.json" if is_360 else None,
+    }
 
 
 @app.post("/api/cleanup")
-def cleanup_cache() -> JSONResponse:
+async def cleanup_cache() -> dict[str, str]:
     storage.clear_data_root()
-    return JSONResponse({"status": "ok"})
+    return {"status": "ok"}
 
 
 @app.get("/api/scene/{job_id}/status")
-def get_status(job_id: str) -> JSONResponse:
-    status = storage.read_status(job_id)
-    if status is None:
+async def get_status(job_id: str) -> Response:
+    status_bytes = storage.read_status_bytes(job_id)
+    if status_bytes is None:
         raise HTTPException(status_code=404, detail="job not found")
-    return JSONResponse(status)
+    return Response(content=status_bytes, media_type="application/json")
+
+
+# Allowed PLY basenames: anything the upload path can produce (spaces,
+# unicode, ...) except path separators, NUL, and the `.`/`..` names — the
+# same set the old Path(name).name round-trip accepted, but checked with one
+# precompiled regex per request.
+_PLY_NAME_RE = re.compile(r"\A(?!\.\.?\Z)[^/\x00]{1,255}\Z")
+
+
+@lru_cache(maxsize=256)
+def _ply_etag(path: str, mtime_ns: int, size: int) -> str:
+    return f'"{mtime_ns:x}-{size:x}"'
 
 
 @app.get("/api/scene/{job_id}/{ply_name}.ply")
 def get_ply(job_id: str, ply_name: str) -> FileResponse:
-    if Path(ply_name).name != ply_name:
+    if not _PLY_NAME_RE.match(ply_name):
         raise HTTPException(status_code=400, detail="invalid ply filename")
     ply_file = storage.job_dir(job_id) / f"{ply_name}.ply"
-    if not ply_file.exists():
+    try:
+        stat_result = os.stat(ply_file)
+    except OSError:
         status = storage.read_status(job_id)
         detail = "scene not ready"
         if status and status.get("status") == "error":
             detail = f"job failed: {status.get('message', '')}"
-        raise HTTPException(status_code=404, detail=detail)
-    return FileResponse(ply_file, media_type="application/octet-stream")
+        raise HTTPException(status_code=404, detail=detail) from None
+    return FileResponse(
+        ply_file,
+        media_type="application/octet-stream",
+        stat_result=stat_result,
+        headers={
+            "ETag": _ply_etag(str(ply_file), stat_result.st_mtime_ns, stat_result.st_size),
+            "Cache-Control": "public, max-age=60",
+        },
+    )
 
 
 
 
 @app.get("/api/scene/{job_id}/logs")
-def get_logs(job_id: str) -> JSONResponse:
+def get_logs(job_id: str) -> dict[str, str]:
+    # Sync on purpose: full-file reads of potentially large logs belong on
+    # the threadpool, not the event loop.
     stdout_path = storage.stdout_log_path(job_id)
     stderr_path = storage.stderr_log_path(job_id)
     if not stdout_path.exists() and not stderr_path.exists():
         raise HTTPException(status_code=404, detail="logs not found")
     stdout_text = stdout_path.read_text(encoding="utf-8") if stdout_path.exists() else ""
     stderr_text = stderr_path.read_text(encoding="utf-8") if stderr_path.exists() else ""
-    return JSONResponse({"stdout": stdout_text, "stderr": stderr_text})
+    return {"stdout": stdout_text, "stderr": stderr_text}
+
+
+@app.get("/api/scene/{job_id}/logs/{stream}")
+async def stream_log(job_id: str, stream: str, since: int = 0) -> StreamingResponse:
+    """
+    Tail one log stream incrementally. Pass the previous response's
+    X-Log-Size as ?since= to receive only the bytes appended since then.
+    """
+
+    if stream == "stdout":
+        log_path = storage.stdout_log_path(job_id)
+    elif stream == "stderr":
+        log_path = storage.stderr_log_path(job_id)
+    else:
+        raise HTTPException(status_code=404, detail="unknown log stream")
+    try:
+        size = os.stat(log_path).st_size
+    except OSError:
+        raise HTTPException(status_code=404, detail="logs not found") from None
+    offset = max(0, min(since, size))
+
+    async def iter_log():
+        async with aiofiles.open(log_path, "rb") as f:
+            await f.seek(offset)
+            remaining = size - offset
+            while remaining > 0:
+                chunk = await f.read(min(remaining, 64 * 1024))
+                if not chunk:
+                    break
+                remaining -= len(chunk)
+                yield chunk
+
+    return StreamingResponse(
+        iter_log(), media_type="text/plain", headers={"X-Log-Size": str(size)}
+    )
 
 
 @app.get("/api/scene/{job_id}/metadata.json")
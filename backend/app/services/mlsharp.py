@@ -9,15 +9,34 @@ This module follows the contract in ExecPlan.md:
 
 from __future__ import annotations
 
+import asyncio
 import os
 import shutil
 import subprocess
 from dataclasses import dataclass
 from pathlib import Path
 
+from plyfile import PlyData
+
 from . import storage
 
 
+def _probe_wrapper() -> str | None:
+    """
+    Locate the bundled ml_sharp_wrapper.sh once; probed at import time so the
+    per-job path avoids repeated filesystem checks.
+    """
+
+    repo_root = Path(__file__).resolve().parents[3]
+    wrapper_path = repo_root / "scripts" / "ml_sharp_wrapper.sh"
+    if wrapper_path.exists() and os.access(wrapper_path, os.X_OK):
+        return str(wrapper_path)
+    return None
+
+
+_DEFAULT_WRAPPER: str | None = _probe_wrapper()
+
+
 @dataclass
 class MlSharpJob:
     job_id: str
@@ -35,19 +54,7 @@ def resolve_cli(custom_cli: str | None) -> str:
     Pick the ml-sharp command to run.
     """
 
-    if custom_cli:
-        return custom_cli
-
-    env_cli = os.environ.get("ML_SHARP_CLI")
-    if env_cli:
-        return env_cli
-
-    repo_root = Path(__file__).resolve().parents[3]
-    wrapper_path = repo_root / "scripts" / "ml_sharp_wrapper.sh"
-    if wrapper_path.exists() and os.access(wrapper_path, os.X_OK):
-        return str(wrapper_path)
-
-    return "sharp"
+    return custom_cli or os.environ.get("ML_SHARP_CLI") or _DEFAULT_WRAPPER or "sharp"
 
 
 def run_mlsharp(
@@ -66,40 +73,146 @@ def run_mlsharp(
         MlSharpError: if the CLI fails or the output PLY is missing.
     """
 
-    cli = resolve_cli(job.cli)
-    stdout_path = stdout_path or storage.stdout_log_path(job.job_id)
-    stderr_path = stderr_path or storage.stderr_log_path(job.job_id)
-    input_stem = job.input_image.stem or "scene"
-    ply_out = job.workdir / f"{input_stem}.ply"
+    cli, cmd, ply_out = _build_command(job)
+    stdout_fd, stderr_fd = _open_log_fds(job, stdout_path, stderr_path, append_logs)
+    try:
+        result = subprocess.run(
+            cmd,
+            cwd=job.workdir,
+            stdout=stdout_fd,
+            stderr=stderr_fd,
+            check=False,
+        )
+    except FileNotFoundError as exc:
+        raise MlSharpError(
+            f"ml-sharp CLI not found: tried '{cli}'. Set ML_SHARP_CLI to an absolute path."
+        ) from exc
+    finally:
+        os.close(stdout_fd)
+        os.close(stderr_fd)
 
-    cmd = [cli, "--input", str(job.input_image), "--output", str(ply_out)]
+    return _finalize_output(job, result.returncode, ply_out)
+
+
+async def run_mlsharp_async(
+    job: MlSharpJob,
+    stdout_path: Path | None = None,
+    stderr_path: Path | None = None,
+    append_logs: bool = False,
+) -> Path:
+    """
+    Async variant of run_mlsharp that awaits the subprocess instead of
+    blocking a worker thread for the whole CLI run.
+    """
 
+    cli, cmd, ply_out = _build_command(job)
+    stdout_fd, stderr_fd = _open_log_fds(job, stdout_path, stderr_path, append_logs)
     try:
-        stdout_mode = "a" if append_logs else "w"
-        stderr_mode = "a" if append_logs else "w"
-        with stdout_path.open(stdout_mode, encoding="utf-8") as stdout_file, stderr_path.open(
-            stderr_mode, encoding="utf-8"
-        ) as stderr_file:
-            result = subprocess.run(
-                cmd,
-                cwd=job.workdir,
-                stdout=stdout_file,
-                stderr=stderr_file,
-                check=False,
-            )
+        proc = await asyncio.create_subprocess_exec(
+            *cmd,
+            cwd=job.workdir,
+            stdout=stdout_fd,
+            stderr=stderr_fd,
+        )
+        returncode = await proc.wait()
     except FileNotFoundError as exc:
         raise MlSharpError(
             f"ml-sharp CLI not found: tried '{cli}'. Set ML_SHARP_CLI to an absolute path."
         ) from exc
+    finally:
+        os.close(stdout_fd)
+        os.close(stderr_fd)
+
+    return _finalize_output(job, returncode, ply_out)
+
+
+def _build_command(job: MlSharpJob) -> tuple[str, list[str], Path]:
+    cli = resolve_cli(job.cli)
+    input_stem = job.input_image.stem or "scene"
+    ply_out = job.workdir / f"{input_stem}.ply"
+    cmd = [cli, "--input", str(job.input_image), "--output", str(ply_out)]
+    return cli, cmd, ply_out
 
-    if result.returncode != 0:
-        raise MlSharpError(f"ml-sharp exited with code {result.returncode}")
+
+def _open_log_fds(
+    job: MlSharpJob,
+    stdout_path: Path | None,
+    stderr_path: Path | None,
+    append_logs: bool,
+) -> tuple[int, int]:
+    # Hand the child raw fds so it writes logs directly, without going
+    # through Python file objects and their buffering.
+    stdout_path = stdout_path or storage.stdout_log_path(job.job_id)
+    stderr_path = stderr_path or storage.stderr_log_path(job.job_id)
+    flags = os.O_WRONLY | os.O_CREAT | (os.O_APPEND if append_logs else os.O_TRUNC)
+    return os.open(stdout_path, flags, 0o644), os.open(stderr_path, flags, 0o644)
+
+
+def _finalize_output(job: MlSharpJob, returncode: int, ply_out: Path) -> Path:
+    if returncode != 0:
+        raise MlSharpError(f"ml-sharp exited with code {returncode}")
 
     if not ply_out.exists():
         raise MlSharpError("ml-sharp finished but output PLY not found")
 
+    _ensure_binary_little_endian(ply_out)
+
     scene_ply = job.workdir / "scene.ply"
     if scene_ply != ply_out:
-        shutil.copyfile(ply_out, scene_ply)
+        _link_or_copy(ply_out, scene_ply)
 
     return ply_out
+
+
+def _ensure_binary_little_endian(ply_path: Path) -> None:
+    """
+    Rewrite ASCII or big-endian PLY output as binary_little_endian.
+
+    The viewer slurps vertex records as one contiguous typed-array read, which
+    only works when the file body matches the in-memory layout. ml-sharp emits
+    binary little-endian already, so the common case is a cheap header sniff.
+    """
+
+    with ply_path.open("rb") as f:
+        header = f.read(256)
+    if b"format binary_little_endian" in header:
+        return
+    ply = PlyData.read(ply_path)
+    PlyData(list(ply.elements), text=False, byte_order="<").write(ply_path)
+
+
+def _link_or_copy(src: Path, dst: Path) -> None:
+    """
+    Materialize dst as a hardlink to src, falling back to a byte copy when
+    linking is unsupported (e.g. cross-device). A hardlink is an O(1)
+    metadata op, so the duplicate scene.ply costs no extra disk space.
+    """
+
+    dst.unlink(missing_ok=True)
+    try:
+        os.link(src, dst)
+    except OSError:
+        _fast_copy(src, dst)
+
+
+def _fast_copy(src: Path, dst: Path) -> None:
+    """
+    Copy via os.sendfile so the bytes move kernel-side instead of being
+    shuttled through 64 KiB userspace buffers; falls back to shutil with a
+    large buffer where sendfile is unavailable.
+    """
+
+    with src.open("rb") as fsrc, dst.open("wb") as fdst:
+        size = os.fstat(fsrc.fileno()).st_size
+        try:
+            offset = 0
+            while offset < size:
+                sent = os.sendfile(fdst.fileno(), fsrc.fileno(), offset, size - offset)
+                if sent == 0:
+                    break
+                offset += sent
+        except OSError:
+            fsrc.seek(0)
+            fdst.seek(0)
+            fdst.truncate()
+            shutil.copyfileobj(fsrc, fdst, length=4 << 20)
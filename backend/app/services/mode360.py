@@ -9,19 +9,30 @@ This module only defines the interfaces and metadata for the future 360 pipeline
 
 from __future__ import annotations
 
-import json
 import math
 import os
 import shutil
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
 import numpy as np
 import piexif
+from numpy.lib.recfunctions import structured_to_unstructured
 from PIL import Image
-from plyfile import PlyData, PlyElement
+from plyfile import PlyData
+
+try:  # Optional: JIT-fused face rendering (install with the [perf] extra).
+    import numba
+except ImportError:  # pragma: no cover - exercised on minimal installs
+    numba = None
+
+try:  # Optional: SIMD bilinear remap (install with the [perf] extra).
+    import cv2
+except ImportError:  # pragma: no cover - exercised on minimal installs
+    cv2 = None
 
 from . import mlsharp, storage
 
@@ -156,12 +167,17 @@ def extract_cube_faces(
 
     face_size = height
     img_np = np.asarray(img)
+    # Every face's ray directions are a rigid rotation of the +Z grid, so the
+    # grid assembly and normalization happen once; each face then costs only
+    # a 3x3 GEMM before the lon/lat math.
+    base_dirs = _face_base_dirs(face_size, clamped_fov)
 
     extractions: list[CubeFaceExtraction] = []
+    face_images: list[tuple[Path, np.ndarray]] = []
     for face in FACE_SPECS:
         face_out = workdir / f"face_{face.index}.jpg"
-        face_img = _render_face(img_np, face_size, face, clamped_fov)
-        _save_face_jpeg(face_out, face_img, clamped_fov, face_size)
+        face_img = _render_face(img_np, face_size, face, clamped_fov, base_dirs)
+        face_images.append((face_out, face_img))
         extractions.append(
             CubeFaceExtraction(
                 face=CubeFaceSpec(
@@ -176,6 +192,16 @@ def extract_cube_faces(
             )
         )
 
+    # Pillow's JPEG encode releases the GIL, so the six quality-95 saves
+    # overlap almost linearly on a thread pool instead of running back to back.
+    with ThreadPoolExecutor(max_workers=len(face_images)) as pool:
+        futures = [
+            pool.submit(_save_face_jpeg, face_out, face_img, clamped_fov, face_size)
+            for face_out, face_img in face_images
+        ]
+        for future in futures:
+            future.result()
+
     return extractions
 
 
@@ -202,17 +228,30 @@ def process_equirectangular_job(
     face_outputs: list[dict[str, Any]] = []
     ply_paths: list[Path] = []
 
-    for face in faces:
+    # ml-sharp is an external CLI, so the six faces are independent and can
+    # overlap; each run logs to its own temp files, which are concatenated
+    # into the job logs in face-index order afterwards.
+    def run_face(face: CubeFaceExtraction) -> None:
         job = mlsharp.MlSharpJob(
             job_id=job_id, input_image=face.image_path, workdir=workdir, cli=mlsharp_cli
         )
-        with stdout_path.open("a", encoding="utf-8") as stdout_file:
-            stdout_file.write(
-                f"=== ml-sharp face {face.face.index} ({face.face.name}) ===\n"
-            )
-        mlsharp.run_mlsharp(job, stdout_path=stdout_path, stderr_path=stderr_path, append_logs=True)
+        stem = face.image_path.stem
+        mlsharp.run_mlsharp(
+            job,
+            stdout_path=workdir / f"{stem}.stdout.log",
+            stderr_path=workdir / f"{stem}.stderr.log",
+        )
+
+    parallel = max(1, int(os.environ.get("SPLAT_MODE360_PARALLEL", "2")))
+    try:
+        with ThreadPoolExecutor(max_workers=parallel) as pool:
+            for future in [pool.submit(run_face, face) for face in faces]:
+                future.result()
+    finally:
+        _collect_face_logs(faces, workdir, stdout_path, stderr_path)
+
+    for face in faces:
         ply_path = workdir / f"{face.image_path.stem}.ply"
-        _apply_face_rotation(ply_path, face.face)
         ply_paths.append(ply_path)
         face_outputs.append(
             {
@@ -227,15 +266,58 @@ def process_equirectangular_job(
             }
         )
 
-    _align_face_layers(ply_paths, faces, stdout_path)
-    _apply_global_flip_and_center(ply_paths, stdout_path)
+    # Decide every per-face transform (rotation, overlap adjust, global flip
+    # and centering) from cheap position-only loads, then rewrite each PLY
+    # exactly once with the accumulated affine instead of three read/write
+    # passes per face.
+    rotations = {
+        face.face.name: np.stack(_face_basis(face.face.name), axis=1) for face in faces
+    }
+    # The six vertex-block reads are independent and I/O bound (np.fromfile
+    # releases the GIL), so overlap them on a thread pool before rotating.
+    with ThreadPoolExecutor(max_workers=max(1, len(ply_paths))) as pool:
+        loaded = list(pool.map(_load_positions, ply_paths))
+    rotated_positions = {
+        face.face.name: positions @ rotations[face.face.name].T
+        for face, positions in zip(faces, loaded)
+    }
+    del loaded
+    adjustments = _align_face_layers(rotated_positions, faces, stdout_path)
+    center = _compute_global_center(list(rotated_positions.values()))
+    del rotated_positions
+    flip = np.diag([1.0, -1.0, 1.0]).astype(np.float32)
+    with stdout_path.open("a", encoding="utf-8") as stdout_file:
+        stdout_file.write(
+            "=== 360 global normalize ===\n"
+            f"center={center[0]:.3f},{center[1]:.3f},{center[2]:.3f}\n"
+        )
+    for face, path in zip(faces, ply_paths):
+        name = face.face.name
+        rot = rotations[name]
+        scale_mat = np.eye(3, dtype=np.float32)
+        trans = np.zeros(3, dtype=np.float32)
+        if name in adjustments:
+            scale, offset = adjustments[name]
+            forward = _face_forward(face.face)
+            scale_mat += (scale - 1.0) * np.outer(forward, forward)
+            trans = offset * forward
+        linear = flip @ scale_mat @ rot
+        _apply_full_transform(path, rot, linear, flip @ trans - center)
 
     merged_path = workdir / f"{input_image.stem}.ply"
     merged_ply = None
-    merge_cli = _resolve_merge_cli()
+    merge_cli = os.environ.get("SPLAT_MERGE_CLI")
     if merge_cli:
         if _merge_plys(merge_cli, merged_path, ply_paths, stdout_path, stderr_path):
             merged_ply = merged_path.name
+    elif _merge_plys_inproc(merged_path, ply_paths, stdout_path):
+        merged_ply = merged_path.name
+    else:
+        fallback_cli = shutil.which("splat-transform")
+        if fallback_cli and _merge_plys(
+            fallback_cli, merged_path, ply_paths, stdout_path, stderr_path
+        ):
+            merged_ply = merged_path.name
 
     overscan_fov = faces[0].face.fov_deg if faces else DEFAULT_OVERSCAN_FOV_DEG
     metadata = {
@@ -247,39 +329,223 @@ def process_equirectangular_job(
             "layers": [path.name for path in ply_paths],
         }
     }
-    storage.metadata_path(job_id).write_text(
-        json.dumps(metadata, ensure_ascii=False, indent=2), encoding="utf-8"
-    )
+    storage.write_metadata(job_id, metadata)
     return metadata
 
 
+def _collect_face_logs(
+    faces: list[CubeFaceExtraction], workdir: Path, stdout_path: Path, stderr_path: Path
+) -> None:
+    """
+    Fold per-face temp logs into the job logs in face-index order, so the
+    "=== ml-sharp face i ===" sectioning survives concurrent runs.
+    """
+
+    with stdout_path.open("ab") as stdout_file, stderr_path.open("ab") as stderr_file:
+        for face in faces:
+            stem = face.image_path.stem
+            stdout_file.write(
+                f"=== ml-sharp face {face.face.index} ({face.face.name}) ===\n".encode("utf-8")
+            )
+            for temp_path, target in (
+                (workdir / f"{stem}.stdout.log", stdout_file),
+                (workdir / f"{stem}.stderr.log", stderr_file),
+            ):
+                if temp_path.exists():
+                    target.write(temp_path.read_bytes())
+                    temp_path.unlink()
+
+
+if numba is not None:
+
+    @numba.njit(parallel=True, fastmath=True, cache=True)
+    def _render_face_numba(
+        image: np.ndarray,
+        out: np.ndarray,
+        face_size: int,
+        tan_half: float,
+        right: np.ndarray,
+        up: np.ndarray,
+        forward: np.ndarray,
+    ) -> None:
+        """
+        Fused projection + bilinear sampling: one pass over the output with
+        per-pixel math in registers, instead of a dozen full-face temporaries.
+        """
+
+        height, width = image.shape[0], image.shape[1]
+        for j in numba.prange(face_size):
+            fy = (j + 0.5) / face_size * 2.0 - 1.0
+            for i in range(face_size):
+                fx = (i + 0.5) / face_size * 2.0 - 1.0
+                dx = forward[0] + fx * tan_half * right[0] + fy * tan_half * up[0]
+                dy = forward[1] + fx * tan_half * right[1] + fy * tan_half * up[1]
+                dz = forward[2] + fx * tan_half * right[2] + fy * tan_half * up[2]
+                inv_norm = 1.0 / max(math.sqrt(dx * dx + dy * dy + dz * dz), 1e-8)
+                x = dx * inv_norm
+                y = dy * inv_norm
+                z = dz * inv_norm
+
+                lon = math.atan2(x, z)
+                lat = math.asin(min(1.0, max(-1.0, y)))
+                u = (lon / (2.0 * math.pi) + 0.5) * width
+                v = (0.5 - lat / math.pi) * height
+
+                u = u % width
+                v = min(max(v, 0.0), height - 1.0)
+                x0 = int(u)
+                y0 = int(v)
+                x1 = (x0 + 1) % width
+                y1 = min(y0 + 1, height - 1)
+                du = u - x0
+                dv = v - y0
+                for ch in range(3):
+                    c0 = image[y0, x0, ch] * (1.0 - du) + image[y0, x1, ch] * du
+                    c1 = image[y1, x0, ch] * (1.0 - du) + image[y1, x1, ch] * du
+                    out[j, i, ch] = np.uint8(c0 * (1.0 - dv) + c1 * dv)
+
+    @numba.njit(parallel=True, cache=True)
+    def _bbox_numba(
+        positions: np.ndarray,
+    ) -> tuple[float, float, float, float, float, float]:
+        """
+        Fused per-axis min/max over (N, 3) positions in one parallel pass.
+        """
+
+        min_x = min_y = min_z = np.inf
+        max_x = max_y = max_z = -np.inf
+        for i in numba.prange(positions.shape[0]):
+            min_x = min(min_x, positions[i, 0])
+            min_y = min(min_y, positions[i, 1])
+            min_z = min(min_z, positions[i, 2])
+            max_x = max(max_x, positions[i, 0])
+            max_y = max(max_y, positions[i, 1])
+            max_z = max(max_z, positions[i, 2])
+        return min_x, min_y, min_z, max_x, max_y, max_z
+
+
+def _face_sample_grids(face_size: int, fov_deg: float) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Build the tan-scaled float32 pixel-center grids shared by all faces.
+    """
+
+    tan_half = math.tan(math.radians(fov_deg * 0.5))
+    axis = ((np.arange(face_size, dtype=np.float32) + 0.5) / face_size * 2 - 1) * np.float32(
+        tan_half
+    )
+    return np.meshgrid(axis, axis)
+
+
+def _face_base_dirs(face_size: int, fov_deg: float) -> np.ndarray:
+    """
+    Build the normalized +Z ray-direction grid shared by all six faces.
+
+    The basis vectors and grids are float32; keep every intermediate there
+    too — full-face float64 temporaries double the bytes touched per face.
+    """
+
+    grid_x, grid_y = _face_sample_grids(face_size, fov_deg)
+    right, up, forward = _face_basis("+Z")
+    dirs = (
+        forward[None, None, :]
+        + grid_x[..., None] * right[None, None, :]
+        + grid_y[..., None] * up[None, None, :]
+    )
+    norm = np.linalg.norm(dirs, axis=-1, keepdims=True)
+    dirs /= np.maximum(norm, np.float32(1e-8))
+    return dirs
+
+
 def _render_face(
-    image_np: np.ndarray, face_size: int, face: CubeFaceSpec, fov_deg: float
+    image_np: np.ndarray,
+    face_size: int,
+    face: CubeFaceSpec,
+    fov_deg: float,
+    base_dirs: np.ndarray | None = None,
 ) -> np.ndarray:
     height, width, _ = image_np.shape
     tan_half = math.tan(math.radians(fov_deg * 0.5))
-    xs = (np.arange(face_size) + 0.5) / face_size * 2 - 1
-    ys = (np.arange(face_size) + 0.5) / face_size * 2 - 1
-    grid_x, grid_y = np.meshgrid(xs, ys)
-    right, up, forward = _face_basis(face.name)
-    dir_world = (
-        forward[None, None, :]
-        + (grid_x * tan_half)[..., None] * right[None, None, :]
-        + (grid_y * tan_half)[..., None] * up[None, None, :]
-    )
-    norm = np.linalg.norm(dir_world, axis=-1, keepdims=True)
-    dir_world = dir_world / np.maximum(norm, 1e-8)
+    if numba is not None:
+        right, up, forward = _face_basis(face.name)
+        out = np.empty((face_size, face_size, 3), dtype=np.uint8)
+        _render_face_numba(
+            image_np,
+            out,
+            face_size,
+            tan_half,
+            right.astype(np.float64),
+            up.astype(np.float64),
+            forward.astype(np.float64),
+        )
+        return out
+    if base_dirs is None:
+        base_dirs = _face_base_dirs(face_size, fov_deg)
+    if face.name == "+Z":
+        dir_world = base_dirs
+    else:
+        # basis_face @ basis_+Z^T maps +Z rays onto this face; rotations
+        # preserve length, so the normalized base grid stays normalized and
+        # the per-face work collapses to one small GEMM.
+        basis = np.stack(_face_basis(face.name), axis=1)
+        z_basis = np.stack(_face_basis("+Z"), axis=1)
+        rot = (basis @ z_basis.T).astype(np.float32)
+        dir_world = (base_dirs.reshape(-1, 3) @ rot.T).reshape(base_dirs.shape)
     x = dir_world[..., 0]
     y = dir_world[..., 1]
     z = dir_world[..., 2]
 
-    lon = np.arctan2(x, z)
-    lat = np.arcsin(np.clip(y, -1.0, 1.0))
+    if os.environ.get("SPLAT_FAST_ERP") == "1":
+        lon = _fast_atan2(x, z)
+        lat = _fast_atan2(y, np.sqrt(x * x + z * z))
+    else:
+        lon = np.arctan2(x, z)
+        lat = np.arcsin(np.clip(y, np.float32(-1.0), np.float32(1.0)))
+
+    u = (lon / np.float32(2 * math.pi) + np.float32(0.5)) * np.float32(width)
+    v = (np.float32(0.5) - lat / np.float32(math.pi)) * np.float32(height)
+
+    if cv2 is not None:
+        # cv2.remap runs the 4-tap interpolation in SIMD C++; wrap u and clamp
+        # v up front so BORDER_WRAP only has to handle the longitude seam.
+        u = np.mod(u, np.float32(width))
+        v = np.clip(v, np.float32(0.0), np.float32(height - 1))
+        return cv2.remap(
+            image_np, u, v, interpolation=cv2.INTER_LINEAR, borderMode=cv2.BORDER_WRAP
+        )
+    return _sample_bilinear(image_np, u, v)
 
-    u = (lon / (2 * math.pi) + 0.5) * width
-    v = (0.5 - lat / math.pi) * height
 
-    return _sample_bilinear(image_np, u, v)
+# Minimax coefficients for atan(t) on [0, 1] (Abramowitz & Stegun 4.4.49);
+# max error ~1e-5 rad, i.e. well under half a texel even at 8K panoramas.
+_ATAN_C1 = np.float32(0.9998660)
+_ATAN_C3 = np.float32(-0.3302995)
+_ATAN_C5 = np.float32(0.1801410)
+_ATAN_C7 = np.float32(-0.0851330)
+_ATAN_C9 = np.float32(0.0208351)
+
+
+def _fast_atan2(y: np.ndarray, x: np.ndarray) -> np.ndarray:
+    """
+    Vectorized polynomial atan2 for texel-coordinate generation.
+
+    Octant reduction (swap + sign fixups) brings the argument into [0, 1]
+    where a 5-term minimax polynomial replaces the libm call; enabled via
+    SPLAT_FAST_ERP=1. The latitude asin is derived from this as
+    atan2(y, sqrt(x^2 + z^2)), which stays accurate near the poles where a
+    plain Taylor asin would not.
+    """
+
+    abs_y = np.abs(y)
+    abs_x = np.abs(x)
+    swap = abs_y > abs_x
+    num = np.where(swap, abs_x, abs_y)
+    den = np.where(swap, abs_y, abs_x)
+    t = num / np.maximum(den, np.float32(1e-12))
+    t2 = t * t
+    r = t * (_ATAN_C1 + t2 * (_ATAN_C3 + t2 * (_ATAN_C5 + t2 * (_ATAN_C7 + t2 * _ATAN_C9))))
+    r = np.where(swap, np.float32(0.5 * math.pi) - r, r)
+    r = np.where(x < 0, np.float32(math.pi) - r, r)
+    return np.where(y < 0, -r, r).astype(np.float32, copy=False)
 
 
 def _save_face_jpeg(path: Path, image: np.ndarray, fov_deg: float, face_size: int) -> None:
@@ -298,8 +564,8 @@ def _save_face_jpeg(path: Path, image: np.ndarray, fov_deg: float, face_size: in
 
 def _sample_bilinear(image: np.ndarray, u: np.ndarray, v: np.ndarray) -> np.ndarray:
     height, width, _ = image.shape
-    u = np.mod(u, width)
-    v = np.clip(v, 0, height - 1)
+    u = np.mod(u.astype(np.float32, copy=False), width)
+    v = np.clip(v.astype(np.float32, copy=False), 0, height - 1)
 
     x0 = np.floor(u).astype(np.int32)
     y0 = np.floor(v).astype(np.int32)
@@ -308,15 +574,27 @@ def _sample_bilinear(image: np.ndarray, u: np.ndarray, v: np.ndarray) -> np.ndar
 
     dx = (u - x0)[..., None]
     dy = (v - y0)[..., None]
+    one_minus_dx = np.float32(1.0) - dx
+    one_minus_dy = np.float32(1.0) - dy
+
+    # Accumulate the four taps through two preallocated float32 buffers with
+    # out= ufuncs; the naive composite expression materializes a fresh
+    # full-face temporary per operation.
+    shape = u.shape + (image.shape[2],)
+    acc = np.empty(shape, dtype=np.float32)
+    tmp = np.empty(shape, dtype=np.float32)
 
-    c00 = image[y0, x0]
-    c10 = image[y0, x1]
-    c01 = image[y1, x0]
-    c11 = image[y1, x1]
+    np.multiply(image[y0, x0], one_minus_dx, out=acc)
+    np.multiply(image[y0, x1], dx, out=tmp)
+    np.add(acc, tmp, out=acc)
+    np.multiply(acc, one_minus_dy, out=acc)
 
-    c0 = c00 * (1 - dx) + c10 * dx
-    c1 = c01 * (1 - dx) + c11 * dx
-    return (c0 * (1 - dy) + c1 * dy).astype(np.uint8)
+    np.multiply(image[y1, x0], one_minus_dx, out=tmp)
+    row = np.multiply(image[y1, x1], dx, dtype=np.float32)
+    np.add(tmp, row, out=tmp)
+    np.multiply(tmp, dy, out=tmp)
+    np.add(acc, tmp, out=acc)
+    return acc.astype(np.uint8)
 
 
 def _rotation_matrix(yaw_deg: float, pitch_deg: float, roll_deg: float) -> np.ndarray:
@@ -336,34 +614,45 @@ def _rotation_matrix(yaw_deg: float, pitch_deg: float, roll_deg: float) -> np.nd
 
 
 def _quat_from_matrix(rot: np.ndarray) -> np.ndarray:
-    trace = np.trace(rot)
-    if trace > 0:
-        s = math.sqrt(trace + 1.0) * 2
-        w = 0.25 * s
-        x = (rot[2, 1] - rot[1, 2]) / s
-        y = (rot[0, 2] - rot[2, 0]) / s
-        z = (rot[1, 0] - rot[0, 1]) / s
-    else:
-        if rot[0, 0] > rot[1, 1] and rot[0, 0] > rot[2, 2]:
-            s = math.sqrt(1.0 + rot[0, 0] - rot[1, 1] - rot[2, 2]) * 2
-            w = (rot[2, 1] - rot[1, 2]) / s
-            x = 0.25 * s
-            y = (rot[0, 1] + rot[1, 0]) / s
-            z = (rot[0, 2] + rot[2, 0]) / s
-        elif rot[1, 1] > rot[2, 2]:
-            s = math.sqrt(1.0 + rot[1, 1] - rot[0, 0] - rot[2, 2]) * 2
-            w = (rot[0, 2] - rot[2, 0]) / s
-            x = (rot[0, 1] + rot[1, 0]) / s
-            y = 0.25 * s
-            z = (rot[1, 2] + rot[2, 1]) / s
-        else:
-            s = math.sqrt(1.0 + rot[2, 2] - rot[0, 0] - rot[1, 1]) * 2
-            w = (rot[1, 0] - rot[0, 1]) / s
-            x = (rot[0, 2] + rot[2, 0]) / s
-            y = (rot[1, 2] + rot[2, 1]) / s
-            z = 0.25 * s
+    """
+    Convert rotation matrices of shape (..., 3, 3) to quaternions (..., 4).
+
+    Branchless largest-of (trace, m00, m11, m22) formulation: every candidate
+    quaternion is computed vectorized and the numerically stable one selected
+    per matrix, so stacked input costs one NumPy pass instead of a Python
+    if/elif ladder per matrix (which also mis-indexed batched input).
+    """
 
-    return np.array([w, x, y, z], dtype=np.float32)
+    rot = np.asarray(rot, dtype=np.float32)
+    m00, m01, m02 = rot[..., 0, 0], rot[..., 0, 1], rot[..., 0, 2]
+    m10, m11, m12 = rot[..., 1, 0], rot[..., 1, 1], rot[..., 1, 2]
+    m20, m21, m22 = rot[..., 2, 0], rot[..., 2, 1], rot[..., 2, 2]
+
+    terms = np.stack(
+        [1.0 + m00 + m11 + m22, 1.0 + m00 - m11 - m22, 1.0 - m00 + m11 - m22, 1.0 - m00 - m11 + m22],
+        axis=-1,
+    )
+    # Replicate the scalar ladder's predicate exactly: the trace case when
+    # trace > 0, otherwise the largest diagonal entry. An argmax over the
+    # sqrt arguments is not equivalent for improper matrices (det = -1, e.g.
+    # the +X/-X/-Z face bases) and would change the emitted quaternions.
+    trace = m00 + m11 + m22
+    diag_case = np.where((m00 > m11) & (m00 > m22), 1, np.where(m11 > m22, 2, 3))
+    case = np.where(trace > 0, 0, diag_case)
+    s = 2.0 * np.sqrt(np.maximum(np.take_along_axis(terms, case[..., None], axis=-1)[..., 0], 1e-12))
+
+    quarter = 0.25 * s
+    candidates = np.stack(
+        [
+            np.stack([quarter, (m21 - m12) / s, (m02 - m20) / s, (m10 - m01) / s], axis=-1),
+            np.stack([(m21 - m12) / s, quarter, (m01 + m10) / s, (m02 + m20) / s], axis=-1),
+            np.stack([(m02 - m20) / s, (m01 + m10) / s, quarter, (m12 + m21) / s], axis=-1),
+            np.stack([(m10 - m01) / s, (m02 + m20) / s, (m12 + m21) / s, quarter], axis=-1),
+        ],
+        axis=-2,
+    )
+    quat = np.take_along_axis(candidates, case[..., None, None], axis=-2)[..., 0, :]
+    return quat.astype(np.float32, copy=False)
 
 
 def _quat_multiply(q1: np.ndarray, q2: np.ndarray) -> np.ndarray:
@@ -376,85 +665,154 @@ def _quat_multiply(q1: np.ndarray, q2: np.ndarray) -> np.ndarray:
     return np.stack([w, x, y, z], axis=1)
 
 
-def _matrix_from_quat(quat: np.ndarray) -> np.ndarray:
-    w = quat[:, 0]
-    x = quat[:, 1]
-    y = quat[:, 2]
-    z = quat[:, 3]
-    n = w * w + x * x + y * y + z * z
-    n = np.where(n == 0, 1.0, n)
-    s = 2.0 / n
-    wx = s * w * x
-    wy = s * w * y
-    wz = s * w * z
-    xx = s * x * x
-    xy = s * x * y
-    xz = s * x * z
-    yy = s * y * y
-    yz = s * y * z
-    zz = s * z * z
-    m00 = 1.0 - (yy + zz)
-    m01 = xy - wz
-    m02 = xz + wy
-    m10 = xy + wz
-    m11 = 1.0 - (xx + zz)
-    m12 = yz - wx
-    m20 = xz - wy
-    m21 = yz + wx
-    m22 = 1.0 - (xx + yy)
-    return np.stack(
-        [
-            np.stack([m00, m01, m02], axis=1),
-            np.stack([m10, m11, m12], axis=1),
-            np.stack([m20, m21, m22], axis=1),
-        ],
-        axis=1,
+def _positions_view(vertex: np.ndarray) -> np.ndarray | None:
+    """
+    Return an (N, 3) float32 view of the x/y/z columns, or None.
+
+    Splat PLYs store x/y/z as three consecutive float32 slots at the front of
+    each record; in that layout the positions can be addressed as a strided
+    (N, 3) array over the existing buffer, so the rotation GEMM reads them
+    without an unstructured copy first.
+    """
+
+    fields = vertex.dtype.fields
+    if (
+        fields is None
+        or not all(key in fields for key in ("x", "y", "z"))
+        or not vertex.flags["C_CONTIGUOUS"]
+    ):
+        return None
+    f4 = np.dtype("<f4")
+    offsets = []
+    for key in ("x", "y", "z"):
+        if fields[key][0] != f4:
+            return None
+        offsets.append(fields[key][1])
+    if offsets[1] - offsets[0] != f4.itemsize or offsets[2] - offsets[1] != f4.itemsize:
+        return None
+    return np.ndarray(
+        shape=(vertex.shape[0], 3),
+        dtype=np.float32,
+        buffer=vertex,
+        offset=offsets[0],
+        strides=(vertex.dtype.itemsize, f4.itemsize),
     )
 
 
-def _apply_face_rotation(ply_path: Path, face: CubeFaceSpec) -> None:
+def _positions_of(vertex: np.ndarray) -> np.ndarray:
+    """
+    Expose the x/y/z columns as an (N, 3) array, as a view when the field
+    layout allows it (the common case for splat PLYs) instead of a copy.
+    """
+
+    view = _positions_view(vertex)
+    if view is not None:
+        return view
+    return structured_to_unstructured(vertex[["x", "y", "z"]], copy=False)
+
+
+def _set_positions(vertex: np.ndarray, view: np.ndarray, values: np.ndarray) -> None:
+    """
+    Store (N, 3) position values back into the vertex record array.
+    """
+
+    if np.shares_memory(view, vertex):
+        view[:] = values
+    else:
+        vertex["x"] = values[:, 0]
+        vertex["y"] = values[:, 1]
+        vertex["z"] = values[:, 2]
+
+
+def _apply_full_transform(
+    ply_path: Path, face_rot: np.ndarray, linear: np.ndarray, offset: np.ndarray
+) -> None:
+    """
+    Rewrite a face PLY once with the fully accumulated transform.
+
+    linear/offset carry rotation, overlap scale and global flip+centering;
+    face_rot is the pure rotation part used to update splat orientations
+    (the overlap scale and the flip leave quaternions untouched).
+    """
+
+    # The header parse guarantees the vertex element sits first, so its bytes
+    # can be edited in place through a writable memmap — no header re-emit and
+    # no rewrite of any trailing elements.
+    layout = _parse_binary_ply_header(ply_path)
+    if layout is not None:
+        try:
+            vertex = np.memmap(
+                ply_path, dtype=layout.dtype, mode="r+", offset=layout.offset,
+                shape=(layout.count,),
+            )
+        except (OSError, ValueError):  # truncated or unmappable file
+            vertex = None
+        if vertex is not None:
+            _transform_vertex(vertex, face_rot, linear, offset)
+            vertex.flush()
+            del vertex
+            return
+
+    # plyfile already holds the one full-size buffer; transform its columns in
+    # place rather than duplicating every per-vertex field just to edit a few.
     ply = PlyData.read(ply_path)
-    vertex = ply["vertex"].data.copy()
-    right, up, forward = _face_basis(face.name)
-    rot = np.stack([right, up, forward], axis=1)
+    _transform_vertex(ply["vertex"].data, face_rot, linear, offset)
+    ply.write(ply_path)
 
-    positions = np.stack([vertex["x"], vertex["y"], vertex["z"]], axis=1)
-    positions = positions @ rot.T
-    vertex["x"] = positions[:, 0]
-    vertex["y"] = positions[:, 1]
-    vertex["z"] = positions[:, 2]
+
+def _transform_vertex(
+    vertex: np.ndarray, face_rot: np.ndarray, linear: np.ndarray, offset: np.ndarray
+) -> None:
+    positions = _positions_of(vertex)
+    _set_positions(vertex, positions, positions @ linear.T + offset)
 
     if all(key in vertex.dtype.names for key in ("rot_0", "rot_1", "rot_2", "rot_3")):
         q_existing = np.stack(
             [vertex["rot_0"], vertex["rot_1"], vertex["rot_2"], vertex["rot_3"]], axis=1
         )
-        q_rot = _quat_from_matrix(rot).reshape(1, 4)
-        q_new = _quat_multiply(q_rot.repeat(q_existing.shape[0], axis=0), q_existing)
+        # _quat_multiply broadcasts (1, 4) against (N, 4); no need to tile the
+        # face quaternion N times first.
+        q_rot = _quat_from_matrix(face_rot).reshape(1, 4)
+        q_new = _quat_multiply(q_rot, q_existing)
         vertex["rot_0"] = q_new[:, 0]
         vertex["rot_1"] = q_new[:, 1]
         vertex["rot_2"] = q_new[:, 2]
         vertex["rot_3"] = q_new[:, 3]
 
-    elements = []
-    for element in ply.elements:
-        if element.name == "vertex":
-            elements.append(PlyElement.describe(vertex, "vertex"))
-        else:
-            elements.append(element)
-    updated = PlyData(elements, text=ply.text, byte_order=ply.byte_order)
-    updated.write(ply_path)
-
 
 def _align_face_layers(
-    ply_paths: list[Path],
+    positions_by_face: dict[str, np.ndarray],
     faces: list[CubeFaceExtraction],
     stdout_path: Path,
-) -> None:
-    if len(ply_paths) != len(faces):
-        return
-    face_map = {face.face.name: (face.face, path) for face, path in zip(faces, ply_paths)}
+) -> dict[str, tuple[float, float]]:
+    """
+    Compute per-face depth scale/offset from overlapping regions.
+
+    Operates on in-memory (already rotated) position arrays and adjusts them
+    in place so later pairs see aligned references; returns the adjustments
+    to fold into each face's final transform.
+    """
+
+    adjustments: dict[str, tuple[float, float]] = {}
+    if len(positions_by_face) != len(faces):
+        return adjustments
+    face_map = {face.face.name: face.face for face in faces}
     if "+Z" not in face_map:
-        return
+        return adjustments
+
+    # Unit directions are reused across pairs (the +Z reference appears in
+    # four of them); cache them per face and invalidate only when a face's
+    # positions are adjusted in place.
+    dirs_cache: dict[str, np.ndarray] = {}
+
+    def unit_dirs(name: str) -> np.ndarray:
+        dirs = dirs_cache.get(name)
+        if dirs is None:
+            positions = positions_by_face[name]
+            norms = np.maximum(np.linalg.norm(positions, axis=1, keepdims=True), np.float32(1e-6))
+            dirs = positions / norms
+            dirs_cache[name] = dirs
+        return dirs
 
     pairs = [
         ("+X", "+Z"),
@@ -469,15 +827,16 @@ def _align_face_layers(
         for name, ref_name in pairs:
             if name not in face_map or ref_name not in face_map:
                 continue
-            face_spec, path = face_map[name]
-            ref_spec, ref_path = face_map[ref_name]
-            positions = _load_positions(path)
-            ref_positions = _load_positions(ref_path)
+            face_spec = face_map[name]
+            positions = positions_by_face[name]
+            ref_positions = positions_by_face[ref_name]
             forward = _face_forward(face_spec)
-            ref_forward = _face_forward(ref_spec)
+            ref_forward = _face_forward(face_map[ref_name])
             cos_half = math.cos(math.radians(face_spec.fov_deg * 0.5))
-            sample_a = _sample_overlap(positions, forward, ref_forward, cos_half)
-            sample_b = _sample_overlap(ref_positions, ref_forward, forward, cos_half)
+            sample_a = _sample_overlap(positions, unit_dirs(name), forward, ref_forward, cos_half)
+            sample_b = _sample_overlap(
+                ref_positions, unit_dirs(ref_name), ref_forward, forward, cos_half
+            )
             if sample_a is None or sample_b is None:
                 stdout_file.write(f"skip alignment {name} -> {ref_name}\n")
                 continue
@@ -488,56 +847,154 @@ def _align_face_layers(
                 continue
             scale = float(np.clip(med_b / med_a, 0.5, 2.0))
             offset = med_b - scale * med_a
-            _apply_normal_adjust(path, forward, scale, offset)
+            proj = positions @ forward
+            positions += (scale - 1.0) * proj[:, None] * forward[None, :]
+            positions += offset * forward[None, :]
+            dirs_cache.pop(name, None)
+            adjustments[name] = (scale, float(offset))
             stdout_file.write(
                 f"align {name} -> {ref_name}: scale={scale:.3f}, offset={offset:.3f}\n"
             )
+    return adjustments
+
+
+# plyfile's generic read/write path is pure Python and dominates wall time on
+# large splat files; binary little-endian PLYs (the common case from ml-sharp)
+# are instead parsed with a small header scan plus one np.fromfile.
+_PLY_SCALAR_TYPES = {
+    "char": "i1",
+    "int8": "i1",
+    "uchar": "u1",
+    "uint8": "u1",
+    "short": "i2",
+    "int16": "i2",
+    "ushort": "u2",
+    "uint16": "u2",
+    "int": "i4",
+    "int32": "i4",
+    "uint": "u4",
+    "uint32": "u4",
+    "float": "f4",
+    "float32": "f4",
+    "double": "f8",
+    "float64": "f8",
+}
+
+
+@dataclass(frozen=True)
+class _BinaryPlyLayout:
+    """
+    Header info for a binary little-endian PLY whose first element is vertex.
+    """
+
+    header: bytes
+    dtype: np.dtype
+    count: int
+    offset: int
+    vertex_only: bool
+
+
+def _parse_binary_ply_header(ply_path: Path) -> _BinaryPlyLayout | None:
+    """
+    Scan the PLY header; returns None for ASCII/big-endian/list-property
+    files, which fall back to plyfile.
+    """
+
+    with ply_path.open("rb") as f:
+        header = b""
+        while b"end_header\n" not in header:
+            chunk = f.read(4096)
+            if not chunk or len(header) > 1 << 16:
+                return None
+            header += chunk
+    end = header.index(b"end_header\n") + len(b"end_header\n")
+    header = header[:end]
+    lines = header.decode("ascii", errors="replace").splitlines()
+    if not lines or lines[0].strip() != "ply":
+        return None
+    elements: list[tuple[str, int, list[tuple[str, str]]]] = []
+    fmt_ok = False
+    for line in lines[1:]:
+        parts = line.split()
+        if not parts:
+            continue
+        if parts[0] == "format":
+            fmt_ok = len(parts) >= 2 and parts[1] == "binary_little_endian"
+        elif parts[0] == "element" and len(parts) == 3:
+            elements.append((parts[1], int(parts[2]), []))
+        elif parts[0] == "property" and elements:
+            if parts[1] == "list" or parts[1] not in _PLY_SCALAR_TYPES:
+                return None
+            elements[-1][2].append((parts[-1], "<" + _PLY_SCALAR_TYPES[parts[1]]))
+    if not fmt_ok or not elements or elements[0][0] != "vertex" or not elements[0][2]:
+        return None
+    name, count, props = elements[0]
+    return _BinaryPlyLayout(
+        header=header,
+        dtype=np.dtype(props),
+        count=count,
+        offset=end,
+        vertex_only=len(elements) == 1,
+    )
+
+
+def _fast_read_vertex(ply_path: Path) -> tuple[_BinaryPlyLayout, np.ndarray] | None:
+    layout = _parse_binary_ply_header(ply_path)
+    if layout is None:
+        return None
+    vertex = np.fromfile(ply_path, dtype=layout.dtype, count=layout.count, offset=layout.offset)
+    if vertex.shape[0] != layout.count:
+        return None
+    return layout, vertex
 
 
 def _load_positions(ply_path: Path) -> np.ndarray:
+    fast = _fast_read_vertex(ply_path)
+    if fast is not None and all(key in fast[0].dtype.names for key in ("x", "y", "z")):
+        view = _positions_view(fast[1])
+        if view is not None:
+            return view
+        return structured_to_unstructured(fast[1][["x", "y", "z"]], dtype=np.float32)
     ply = PlyData.read(ply_path)
     vertex = ply["vertex"].data
-    return np.stack([vertex["x"], vertex["y"], vertex["z"]], axis=1).astype(np.float32)
+    return structured_to_unstructured(vertex[["x", "y", "z"]], dtype=np.float32)
+
+
+def _frozen_basis(
+    right: tuple[float, float, float],
+    up: tuple[float, float, float],
+    forward: tuple[float, float, float],
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    vectors = tuple(np.array(v, dtype=np.float32) for v in (right, up, forward))
+    for vector in vectors:
+        vector.flags.writeable = False
+    return vectors
+
+
+# The six bases never change, so build them once at import as read-only
+# float32 vectors instead of allocating fresh arrays on every lookup.
+_FACE_BASIS: dict[str, tuple[np.ndarray, np.ndarray, np.ndarray]] = {
+    "+X": _frozen_basis((0.0, 0.0, -1.0), (0.0, -1.0, 0.0), (1.0, 0.0, 0.0)),
+    "-X": _frozen_basis((0.0, 0.0, 1.0), (0.0, -1.0, 0.0), (-1.0, 0.0, 0.0)),
+    "+Y": _frozen_basis((1.0, 0.0, 0.0), (0.0, 0.0, -1.0), (0.0, 1.0, 0.0)),
+    "-Y": _frozen_basis((1.0, 0.0, 0.0), (0.0, 0.0, 1.0), (0.0, -1.0, 0.0)),
+    "-Z": _frozen_basis((-1.0, 0.0, 0.0), (0.0, -1.0, 0.0), (0.0, 0.0, -1.0)),
+    "+Z": _frozen_basis((1.0, 0.0, 0.0), (0.0, -1.0, 0.0), (0.0, 0.0, 1.0)),
+}
 
 
 def _face_forward(face: CubeFaceSpec) -> np.ndarray:
-    _, _, forward = _face_basis(face.name)
-    norm = np.linalg.norm(forward)
-    if norm == 0:
-        return forward
-    return forward / norm
+    # The forward vectors are axis-aligned unit vectors already.
+    return _face_basis(face.name)[2]
 
 
 def _face_basis(name: str) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
-    if name == "+X":
-        right = np.array([0.0, 0.0, -1.0], dtype=np.float32)
-        up = np.array([0.0, -1.0, 0.0], dtype=np.float32)
-        forward = np.array([1.0, 0.0, 0.0], dtype=np.float32)
-    elif name == "-X":
-        right = np.array([0.0, 0.0, 1.0], dtype=np.float32)
-        up = np.array([0.0, -1.0, 0.0], dtype=np.float32)
-        forward = np.array([-1.0, 0.0, 0.0], dtype=np.float32)
-    elif name == "+Y":
-        right = np.array([1.0, 0.0, 0.0], dtype=np.float32)
-        up = np.array([0.0, 0.0, -1.0], dtype=np.float32)
-        forward = np.array([0.0, 1.0, 0.0], dtype=np.float32)
-    elif name == "-Y":
-        right = np.array([1.0, 0.0, 0.0], dtype=np.float32)
-        up = np.array([0.0, 0.0, 1.0], dtype=np.float32)
-        forward = np.array([0.0, -1.0, 0.0], dtype=np.float32)
-    elif name == "-Z":
-        right = np.array([-1.0, 0.0, 0.0], dtype=np.float32)
-        up = np.array([0.0, -1.0, 0.0], dtype=np.float32)
-        forward = np.array([0.0, 0.0, -1.0], dtype=np.float32)
-    else:  # +Z
-        right = np.array([1.0, 0.0, 0.0], dtype=np.float32)
-        up = np.array([0.0, -1.0, 0.0], dtype=np.float32)
-        forward = np.array([0.0, 0.0, 1.0], dtype=np.float32)
-    return right, up, forward
+    return _FACE_BASIS.get(name, _FACE_BASIS["+Z"])
 
 
 def _sample_overlap(
     positions: np.ndarray,
+    dirs: np.ndarray,
     face_forward: np.ndarray,
     other_forward: np.ndarray,
     cos_half: float,
@@ -545,108 +1002,122 @@ def _sample_overlap(
 ) -> np.ndarray | None:
     if positions.size == 0:
         return None
-    norms = np.linalg.norm(positions, axis=1, keepdims=True)
-    norms = np.maximum(norms, 1e-6)
-    dirs = positions / norms
     mask = (dirs @ face_forward) >= cos_half
     mask &= (dirs @ other_forward) >= cos_half
     idx = np.flatnonzero(mask)
     if idx.size == 0:
         return None
     if idx.size > max_samples:
-        idx = np.random.choice(idx, size=max_samples, replace=False)
+        idx = idx[_sample_indices(idx.size, max_samples)]
     proj = positions[idx] @ face_forward
     return proj[np.isfinite(proj)]
 
 
-def _apply_normal_adjust(
-    ply_path: Path, forward: np.ndarray, scale: float, offset: float
-) -> None:
-    ply = PlyData.read(ply_path)
-    vertex = ply["vertex"].data.copy()
-    positions = np.stack([vertex["x"], vertex["y"], vertex["z"]], axis=1)
-    proj = positions @ forward
-    positions += (scale - 1.0) * proj[:, None] * forward[None, :]
-    positions += offset * forward[None, :]
-    vertex["x"] = positions[:, 0]
-    vertex["y"] = positions[:, 1]
-    vertex["z"] = positions[:, 2]
-    elements = []
-    for element in ply.elements:
-        if element.name == "vertex":
-            elements.append(PlyElement.describe(vertex, "vertex"))
-        else:
-            elements.append(element)
-    updated = PlyData(elements, text=ply.text, byte_order=ply.byte_order)
-    updated.write(ply_path)
+_rng = np.random.default_rng()
 
 
-def _apply_global_flip_and_center(ply_paths: list[Path], stdout_path: Path) -> None:
-    if not ply_paths:
-        return
-    center = _compute_global_center(ply_paths)
-    flip = np.diag([1.0, -1.0, 1.0]).astype(np.float32)
-    with stdout_path.open("a", encoding="utf-8") as stdout_file:
-        stdout_file.write(
-            "=== 360 global normalize ===\n"
-            f"center={center[0]:.3f},{center[1]:.3f},{center[2]:.3f}\n"
-        )
-    for path in ply_paths:
-        _apply_transform(path, flip, -center)
+def _sample_indices(n: int, k: int) -> np.ndarray:
+    """
+    Draw ~k distinct indices in [0, n) with O(k) memory.
 
+    np.random.choice with replace=False permutes all n candidates; a slightly
+    oversized with-replacement draw deduped via np.unique lands within a few
+    percent of k, which is plenty for the median/extent estimates here.
+    """
 
-def _compute_global_center(ply_paths: list[Path], max_samples: int = 200000) -> np.ndarray:
-    mins = np.array([np.inf, np.inf, np.inf], dtype=np.float32)
-    maxs = np.array([-np.inf, -np.inf, -np.inf], dtype=np.float32)
-    for path in ply_paths:
-        positions = _load_positions(path)
+    return np.unique(_rng.integers(0, n, size=k + k // 8))
+
+
+def _compute_global_center(
+    positions_list: list[np.ndarray], max_samples: int = 200000
+) -> np.ndarray:
+    face_mins = []
+    face_maxs = []
+    for positions in positions_list:
         if positions.shape[0] > max_samples:
-            idx = np.random.choice(positions.shape[0], size=max_samples, replace=False)
-            positions = positions[idx]
-        mins = np.minimum(mins, positions.min(axis=0))
-        maxs = np.maximum(maxs, positions.max(axis=0))
-    return (mins + maxs) * 0.5
+            # Duplicates cannot move a min/max, so a plain with-replacement
+            # draw is enough here — no dedup pass needed.
+            positions = positions[_rng.integers(0, positions.shape[0], size=max_samples)]
+        cmin, cmax = _bbox(positions)
+        face_mins.append(cmin)
+        face_maxs.append(cmax)
+    mins = np.minimum.reduce(face_mins)
+    maxs = np.maximum.reduce(face_maxs)
+    return ((mins + maxs) * np.float32(0.5)).astype(np.float32)
 
 
-def _apply_transform(ply_path: Path, rot: np.ndarray, offset: np.ndarray) -> None:
-    ply = PlyData.read(ply_path)
-    vertex = ply["vertex"].data.copy()
-    positions = np.stack([vertex["x"], vertex["y"], vertex["z"]], axis=1)
-    positions = positions @ rot.T + offset
-    vertex["x"] = positions[:, 0]
-    vertex["y"] = positions[:, 1]
-    vertex["z"] = positions[:, 2]
-
-    det = float(np.linalg.det(rot))
-    if det > 0 and all(
-        key in vertex.dtype.names for key in ("rot_0", "rot_1", "rot_2", "rot_3")
-    ):
-        q_existing = np.stack(
-            [vertex["rot_0"], vertex["rot_1"], vertex["rot_2"], vertex["rot_3"]], axis=1
-        )
-        r_existing = _matrix_from_quat(q_existing)
-        r_new = rot @ r_existing @ rot.T
-        q_new = _quat_from_matrix(r_new)
-        vertex["rot_0"] = q_new[:, 0]
-        vertex["rot_1"] = q_new[:, 1]
-        vertex["rot_2"] = q_new[:, 2]
-        vertex["rot_3"] = q_new[:, 3]
+_BBOX_CHUNK_ROWS = 1_000_000
+
+
+def _bbox(positions: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Per-axis min and max of an (N, 3) array in one traversal.
 
-    elements = []
-    for element in ply.elements:
-        if element.name == "vertex":
-            elements.append(PlyElement.describe(vertex, "vertex"))
+    Separate .min()/.max() calls stream the whole array from RAM twice;
+    reducing block by block keeps each ~1M-row chunk cache-hot for the second
+    reduction. With numba installed the fused prange kernel does both in a
+    single parallel pass.
+    """
+
+    if numba is not None and positions.shape[0] > 0 and positions.flags["C_CONTIGUOUS"]:
+        bounds = _bbox_numba(positions)
+        return (
+            np.array(bounds[:3], dtype=positions.dtype),
+            np.array(bounds[3:], dtype=positions.dtype),
+        )
+    mins = maxs = None
+    for start in range(0, positions.shape[0], _BBOX_CHUNK_ROWS):
+        chunk = positions[start : start + _BBOX_CHUNK_ROWS]
+        if mins is None:
+            mins = chunk.min(axis=0)
+            maxs = chunk.max(axis=0)
         else:
-            elements.append(element)
-    updated = PlyData(elements, text=ply.text, byte_order=ply.byte_order)
-    updated.write(ply_path)
+            np.minimum(mins, chunk.min(axis=0), out=mins)
+            np.maximum(maxs, chunk.max(axis=0), out=maxs)
+    return mins, maxs
+
+
+def _merge_plys_inproc(
+    output_path: Path, inputs: list[Path], stdout_path: Path
+) -> bool:
+    """
+    Concatenate the face vertex tables in process.
 
+    The layers are binary little-endian files we just wrote, so merging is one
+    np.concatenate plus a header with the summed vertex count — no subprocess
+    spawn and no re-parse of files that were in memory moments ago. Returns
+    False (so the caller can fall back to the CLI) when any input needs the
+    generic plyfile path or the layouts disagree.
+    """
+
+    loaded: list[tuple[_BinaryPlyLayout, np.ndarray]] = []
+    for path in inputs:
+        fast = _fast_read_vertex(path)
+        if fast is None or not fast[0].vertex_only:
+            return False
+        loaded.append(fast)
+    if not loaded:
+        return False
+    dtype = loaded[0][1].dtype
+    if any(vertex.dtype != dtype for _, vertex in loaded[1:]):
+        return False
 
-def _resolve_merge_cli() -> str | None:
-    env_cli = os.environ.get("SPLAT_MERGE_CLI")
-    if env_cli:
-        return env_cli
-    return shutil.which("splat-transform")
+    merged = np.concatenate([vertex for _, vertex in loaded])
+    first = loaded[0][0]
+    header = first.header.replace(
+        f"element vertex {first.count}".encode("ascii"),
+        f"element vertex {merged.shape[0]}".encode("ascii"),
+        1,
+    )
+    with output_path.open("wb") as f:
+        f.write(header)
+        merged.tofile(f)
+    with stdout_path.open("a", encoding="utf-8") as stdout_file:
+        stdout_file.write(
+            "=== merge 360 ply ===\n"
+            f"merged {merged.shape[0]} splats from {len(inputs)} layers in process\n"
+        )
+    return True
 
 
 def _merge_plys(
@@ -8,12 +8,26 @@ persisted in a small JSON file per job so that it survives process restarts.
 from __future__ import annotations
 
 import json
+import os
 import shutil
+import threading
 from pathlib import Path
 from typing import Any, Literal, TypedDict
 
 DATA_ROOT = Path(__file__).resolve().parents[2] / ".data"
 
+# Completed job outputs are kept under .data/cache/<mode>-<content-digest>
+# so a re-upload of the same image can skip the ml-sharp run entirely; the
+# mode prefix keeps the single and 360 output sets apart, since identical
+# bytes produce different outputs depending on the upload's filename.
+CACHE_DIR_NAME = "cache"
+
+# Status reads are polled at sub-second intervals by the frontend; cache the
+# parsed JSON and its encoded bytes keyed on the file's mtime so each poll
+# costs one stat() at most and never re-encodes the payload.
+_status_cache: dict[str, tuple[int, "JobStatus", bytes]] = {}
+_status_cache_lock = threading.Lock()
+
 
 class JobStatus(TypedDict, total=False):
     status: Literal["pending", "running", "done", "error"]
@@ -33,6 +47,98 @@ def clear_data_root() -> None:
     keep.write_text("", encoding="utf-8")
 
 
+def clear_stale_jobs(keep_job_id: str) -> None:
+    """
+    Remove every job directory except the one for keep_job_id.
+
+    Used to defer cache cleanup off the upload request path: the new job is
+    created first and prior jobs are swept afterwards in the background.
+    """
+
+    root = ensure_data_root()
+    for entry in root.iterdir():
+        if entry.name in (keep_job_id, CACHE_DIR_NAME) or not entry.is_dir():
+            continue
+        shutil.rmtree(entry, ignore_errors=True)
+
+
+def cache_root() -> Path:
+    path = ensure_data_root() / CACHE_DIR_NAME
+    path.mkdir(parents=True, exist_ok=True)
+    return path
+
+
+def restore_cached_outputs(cache_key: str, job_id: str, ply_name: str | None = None) -> bool:
+    """
+    Hardlink the cached outputs for an upload cache key into the job directory.
+
+    ply_name is the PLY filename the new upload's response will point at;
+    cached names derive from the original upload's filename, so when the same
+    bytes arrive under a different name the cached scene is linked to the
+    expected name as well. Returns True when a usable cache entry (at least
+    one PLY) was restored.
+    """
+
+    src = cache_root() / cache_key
+    if not src.is_dir():
+        return False
+    files = [entry for entry in src.iterdir() if entry.is_file()]
+    if not any(entry.suffix == ".ply" for entry in files):
+        return False
+    dst = ensure_job_dir(job_id)
+    for entry in files:
+        target = dst / entry.name
+        target.unlink(missing_ok=True)
+        try:
+            os.link(entry, target)
+        except OSError:
+            shutil.copyfile(entry, target)
+    if ply_name and not (dst / ply_name).exists():
+        scene = dst / "scene.ply"
+        source = scene if scene.exists() else dst / next(
+            entry.name for entry in files if entry.suffix == ".ply"
+        )
+        try:
+            os.link(source, dst / ply_name)
+        except OSError:
+            shutil.copyfile(source, dst / ply_name)
+    return True
+
+
+def cache_job_outputs(cache_key: str, job_id: str) -> None:
+    """
+    Publish a finished job's PLYs (and 360 metadata) under the upload cache.
+
+    The entry is assembled in a temp directory and renamed into place so
+    concurrent readers never see a partial cache hit.
+    """
+
+    src = job_dir(job_id)
+    if not src.is_dir():
+        return
+    dst = cache_root() / cache_key
+    if dst.exists():
+        return
+    tmp = cache_root() / f".{cache_key}.tmp"
+    shutil.rmtree(tmp, ignore_errors=True)
+    tmp.mkdir(parents=True)
+    copied = False
+    for entry in src.iterdir():
+        if not entry.is_file():
+            continue
+        if entry.suffix != ".ply" and entry.name != "metadata.json":
+            continue
+        try:
+            os.link(entry, tmp / entry.name)
+        except OSError:
+            shutil.copyfile(entry, tmp / entry.name)
+        copied = copied or entry.suffix == ".ply"
+    if copied:
+        os.replace(tmp, dst)
+    else:
+        shutil.rmtree(tmp, ignore_errors=True)
+
+
 def job_dir(job_id: str) -> Path:
     """
     Return the path to the job directory without creating it.
@@ -80,17 +186,84 @@ def stderr_log_path(job_id: str) -> Path:
 
 
 def write_status(job_id: str, status: JobStatus) -> None:
+    """
+    Persist the status atomically, skipping writes that would not change it.
+
+    The JSON is written to a sibling temp file and moved into place with
+    os.replace so readers never observe a partially written file.
+    """
+
+    with _status_cache_lock:
+        cached = _status_cache.get(job_id)
+        if cached is not None and cached[1] == dict(status):
+            return
     ensure_job_dir(job_id)
     status_file = status_path(job_id)
-    status_file.write_text(json.dumps(status, ensure_ascii=False, indent=2))
+    payload = json.dumps(status, ensure_ascii=False, indent=2).encode("utf-8")
+    _write_json_atomic(status_file, payload)
+    with _status_cache_lock:
+        _status_cache[job_id] = (status_file.stat().st_mtime_ns, dict(status), payload)
+
+
+def write_metadata(job_id: str, metadata: dict[str, Any]) -> None:
+    """
+    Persist job metadata atomically, mirroring the status write path.
+    """
+
+    payload = json.dumps(metadata, ensure_ascii=False, indent=2).encode("utf-8")
+    _write_json_atomic(metadata_path(job_id), payload)
+
+
+def _write_json_atomic(path: Path, payload: bytes) -> None:
+    """
+    Write payload to a sibling temp file and os.replace it into place, so
+    concurrent readers never observe a partially written JSON file.
+    """
+
+    tmp_file = path.with_name(path.name + ".tmp")
+    tmp_file.write_bytes(payload)
+    os.replace(tmp_file, path)
 
 
 def read_status(job_id: str) -> JobStatus | None:
+    entry = _load_status_entry(job_id)
+    if entry is None:
+        return None
+    return dict(entry[1])
+
+
+def read_status_bytes(job_id: str) -> bytes | None:
+    """
+    Return the canonical JSON bytes of the status file, cache-backed.
+
+    Lets the status endpoint answer polls without re-encoding the payload.
+    """
+
+    entry = _load_status_entry(job_id)
+    if entry is None:
+        return None
+    return entry[2]
+
+
+def _load_status_entry(job_id: str) -> tuple[int, JobStatus, bytes] | None:
     status_file = status_path(job_id)
-    if not status_file.exists():
+    try:
+        mtime_ns = os.stat(status_file).st_mtime_ns
+    except OSError:
+        with _status_cache_lock:
+            _status_cache.pop(job_id, None)
         return None
+    with _status_cache_lock:
+        cached = _status_cache.get(job_id)
+        if cached is not None and cached[0] == mtime_ns:
+            return cached
+    payload = status_file.read_bytes()
     try:
-        data: Any = json.loads(status_file.read_text())
+        data: Any = json.loads(payload)
     except json.JSONDecodeError:
         return None
-    return JobStatus(status=data.get("status", "pending"), message=data.get("message", ""))
+    status = JobStatus(status=data.get("status", "pending"), message=data.get("message", ""))
+    entry = (mtime_ns, status, payload)
+    with _status_cache_lock:
+        _status_cache[job_id] = entry
+    return entry
@@ -40,7 +40,7 @@ trap cleanup EXIT INT TERM
   source .venv/bin/activate
   SPLAT_MERGE_CLI="${SPLAT_MERGE_CLI}" \
   ML_SHARP_CLI="${ROOT_DIR}/scripts/ml_sharp_wrapper.sh" \
-    uvicorn backend.app.main:app --reload --port "${BACKEND_PORT}"
+    uvicorn backend.app.main:app --reload --http httptools --loop uvloop --port "${BACKEND_PORT}"
 ) &
 BACKEND_PID=$!
 
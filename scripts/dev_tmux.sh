@@ -27,7 +27,7 @@ if tmux has-session -t "${SESSION_NAME}" 2>/dev/null; then
 fi
 
 tmux new-session -d -s "${SESSION_NAME}" -c "${ROOT_DIR}" \
-  "bash -lc 'source .venv/bin/activate && uvicorn backend.app.main:app --reload --port ${BACKEND_PORT}'"
+  "bash -lc 'source .venv/bin/activate && uvicorn backend.app.main:app --reload --http httptools --loop uvloop --port ${BACKEND_PORT}'"
 tmux split-window -h -t "${SESSION_NAME}" -c "${ROOT_DIR}/frontend" \
   "bash -lc 'VITE_API_BASE=http://localhost:${BACKEND_PORT} npm run dev -- --port ${FRONTEND_PORT}'"
 tmux select-layout -t "${SESSION_NAME}" even-horizontal